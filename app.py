@@ -1,11 +1,28 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 from collections import defaultdict, deque
-import base64
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from array import array
+import csv
+import functools
+import importlib.util
+import io
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
 from streamlit_lottie import st_lottie
 import requests
 import json
 
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
 # Add custom CSS for better styling
 def add_custom_css():
     st.markdown("""
@@ -449,6 +466,93 @@ def build_canonical_collection(grammar, non_terminals, start_symbol):
         i += 1
     return canonical_collection, goto_table
 
+# Set once per worker process by its initializer, so the grammar is not
+# pickled with every chunk of states. Never set in the parent process.
+_worker_grammar = None
+_worker_non_terminals = None
+
+
+def _init_expansion_worker(grammar, non_terminals):
+    global _worker_grammar, _worker_non_terminals
+    _worker_grammar = grammar
+    _worker_non_terminals = non_terminals
+
+
+def _expand_state(grammar, non_terminals, state):
+    """Return [(symbol, goto state)] for one state, ordered by symbol."""
+    next_symbols = set()
+    for nt, rhs in state:
+        dot_pos = rhs.index('DOT')
+        if dot_pos < len(rhs) - 1:
+            next_symbols.add(rhs[dot_pos + 1])
+    return [(symbol, goto(state, symbol, grammar, non_terminals))
+            for symbol in sorted(next_symbols)]
+
+
+def _expand_state_in_worker(state):
+    return _expand_state(_worker_grammar, _worker_non_terminals, state)
+
+
+def gil_disabled():
+    """True on free-threaded Python builds running without the GIL."""
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def build_canonical_collection_parallel(grammar, non_terminals, start_symbol, workers=None, min_parallel=64):
+    """Build the canonical collection expanding each BFS frontier level in parallel.
+    Goto and closure for every state of a level run in worker processes, or
+    in threads on free-threaded builds. New states are merged in frontier
+    order and by sorted symbol, so numbering is reproducible from run to run.
+    Levels smaller than min_parallel states are expanded in-process.
+    Returns the same (canonical_collection, goto_table) shape as
+    build_canonical_collection().
+    """
+    augmented_start = f"{start_symbol}'"
+    initial_state = closure({(augmented_start, ('DOT', start_symbol))}, grammar, non_terminals)
+
+    canonical_collection = [initial_state]
+    state_ids = {initial_state: 0}
+    goto_table = {}
+
+    workers = workers or os.cpu_count() or 1
+    # In-process and thread expansion get the grammar bound per call, so
+    # concurrent builds never share state; worker processes get their own
+    # copy through the initializer. Pools start lazily, so grammars whose
+    # levels all stay below min_parallel never spawn workers.
+    expand = functools.partial(_expand_state, grammar, non_terminals)
+    if gil_disabled():
+        executor = ThreadPoolExecutor(max_workers=workers)
+        pooled_expand = expand
+    else:
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_expansion_worker,
+                                       initargs=(grammar, non_terminals))
+        pooled_expand = _expand_state_in_worker
+
+    frontier = [0]
+    try:
+        while frontier:
+            states = [canonical_collection[i] for i in frontier]
+            if len(states) < min_parallel:
+                expansions = map(expand, states)
+            else:
+                chunksize = max(1, len(states) // (workers * 4))
+                expansions = executor.map(pooled_expand, states, chunksize=chunksize)
+            next_frontier = []
+            for i, transitions in zip(frontier, expansions):
+                for symbol, next_state in transitions:
+                    j = state_ids.get(next_state)
+                    if j is None:
+                        j = state_ids[next_state] = len(canonical_collection)
+                        canonical_collection.append(next_state)
+                        next_frontier.append(j)
+                    goto_table[(i, symbol)] = j
+            frontier = next_frontier
+    finally:
+        executor.shutdown()
+    return canonical_collection, goto_table
+
+
 # --------------------------
 # Parsing Table Construction
 # --------------------------
@@ -476,7 +580,7 @@ def construct_parsing_table(canonical_collection, goto_table, terminals, non_ter
                             parsing_table[i][next_symbol].append(action)
                 # Reduce or accept if dot is at end
                 elif dot_pos == len(rhs) - 1 or (len(rhs) == 1 and rhs[0] == 'DOT'):
-                    if nt == f"{start_symbol}'" and len(rhs) == 2 and rhs[1] == start_symbol:
+                    if nt == f"{start_symbol}'" and rhs == (start_symbol, 'DOT'):
                         parsing_table[i]['$'].append("acc")
                     else:
                         prod_num = -1
@@ -499,26 +603,821 @@ def construct_parsing_table(canonical_collection, goto_table, terminals, non_ter
     return parsing_table
 
 
+# --------------------------
+# Memory-Bounded Table Construction
+# --------------------------
+
+class DiskParsingTable(Mapping):
+    """Read-only parsing table whose rows live in a BoundedTableBuilder store.
+    Rows hold only non-empty cells, which every consumer of the dense table
+    already tolerates since they look cells up with .get(symbol, []).
+    """
+
+    def __init__(self, connection, state_count):
+        self._connection = connection
+        self._state_count = state_count
+
+    def __len__(self):
+        return self._state_count
+
+    def __iter__(self):
+        return iter(range(self._state_count))
+
+    def __getitem__(self, state):
+        found = self._connection.execute("SELECT row FROM rows WHERE state = ?", (state,)).fetchone()
+        if found is None:
+            raise KeyError(state)
+        return json.loads(found[0])
+
+
+class BoundedTableBuilder:
+    """Build the SLR table with a bounded working set for very large grammars.
+    States are kept only as kernels, encoded as packed item integers
+    (production * stride + dot position), and closures are recomputed on the
+    fly while a state is expanded. Finished rows are written to an SQLite
+    store in batches, and rows() streams each row as soon as its state is
+    expanded. memory_limit_mb caps the kernel registry plus the rows not yet
+    flushed; past it both are spilled to the store. The closure of the state
+    being expanded and SQLite's own page cache are not counted.
+    States are numbered in BFS order with symbols visited in sorted order, so
+    numbering is reproducible but may differ from build_canonical_collection().
+    """
+
+    ROW_BATCH = 1024
+    ENTRY_OVERHEAD = 160
+
+    def __init__(self, terminals, non_terminals, augmented_grammar, follow_sets,
+                 memory_limit_mb=256, store_path=None):
+        self.terminals = terminals
+        self.non_terminals = non_terminals
+        self.rhs = [rhs for _, rhs in augmented_grammar]
+        self.lhs = [nt for nt, _ in augmented_grammar]
+        self.follow_sets = follow_sets
+        self.stride = max(len(rhs) for rhs in self.rhs) + 1
+        # Repeated alternatives share the number of their first occurrence,
+        # matching construct_parsing_table().
+        self.prods_by_lhs = defaultdict(list)
+        first_seen = set()
+        for p, production in enumerate(augmented_grammar):
+            if production not in first_seen:
+                first_seen.add(production)
+                self.prods_by_lhs[production[0]].append(p)
+        self.memory_limit = memory_limit_mb * 1024 * 1024
+
+        self._temp_dir = None
+        if store_path is None:
+            self._temp_dir = tempfile.mkdtemp(prefix="slr-table-")
+            store_path = os.path.join(self._temp_dir, "table.sqlite3")
+        self.connection = sqlite3.connect(store_path)
+        self.connection.executescript("""
+            DROP TABLE IF EXISTS states;
+            DROP TABLE IF EXISTS rows;
+            CREATE TABLE states (id INTEGER PRIMARY KEY, kernel BLOB UNIQUE);
+            CREATE TABLE rows (state INTEGER PRIMARY KEY, row TEXT);
+        """)
+
+        self.state_count = 0
+        self.finished = False
+        self.spills = 0
+        self.peak_rss_mb = None
+        self._kernel_ids = {}
+        self._id_kernels = {}
+        self._next_state = 0
+        self._row_buffer = []
+        self._row_bytes = 0
+        self._buffered_bytes = 0
+
+    def _encode(self, items):
+        return array('i', sorted(items)).tobytes()
+
+    def _register(self, kernel):
+        """Return the state id for a kernel, registering it if new."""
+        state = self._kernel_ids.get(kernel)
+        if state is None and self.spills:
+            found = self.connection.execute("SELECT id FROM states WHERE kernel = ?", (kernel,)).fetchone()
+            state = found[0] if found else None
+        if state is None:
+            state = self.state_count
+            self.state_count += 1
+            self._kernel_ids[kernel] = state
+            self._id_kernels[state] = kernel
+            self._buffered_bytes += len(kernel) + self.ENTRY_OVERHEAD
+        return state
+
+    def _kernel(self, state):
+        kernel = self._id_kernels.get(state)
+        if kernel is None:
+            kernel = self.connection.execute("SELECT kernel FROM states WHERE id = ?", (state,)).fetchone()[0]
+        return kernel
+
+    def _flush_rows(self):
+        if self._row_buffer:
+            self.connection.executemany("INSERT INTO rows VALUES (?, ?)", self._row_buffer)
+            self._row_buffer = []
+            self._buffered_bytes -= self._row_bytes
+            self._row_bytes = 0
+
+    def _spill(self):
+        """Move the kernel registry and buffered rows out to the disk store."""
+        self.connection.executemany(
+            "INSERT INTO states VALUES (?, ?)",
+            ((state, kernel) for state, kernel in self._id_kernels.items()))
+        self._flush_rows()
+        self.connection.commit()
+        self._kernel_ids.clear()
+        self._id_kernels.clear()
+        self._buffered_bytes = 0
+        self.spills += 1
+
+    def _expand(self, state):
+        """Compute the table row of a state, registering its successors."""
+        stride = self.stride
+        rhs_of = self.rhs
+        non_terminals = self.non_terminals
+
+        items = array('i')
+        items.frombytes(self._kernel(state))
+        items = list(items)
+        pending = [rhs_of[p][d] for p, d in (divmod(item, stride) for item in items)
+                   if d < len(rhs_of[p]) and rhs_of[p][d] in non_terminals]
+        seen = set()
+        while pending:
+            nt = pending.pop()
+            if nt in seen:
+                continue
+            seen.add(nt)
+            for p in self.prods_by_lhs[nt]:
+                items.append(p * stride)
+                if rhs_of[p] and rhs_of[p][0] in non_terminals:
+                    pending.append(rhs_of[p][0])
+
+        transitions = defaultdict(list)
+        reductions = []
+        for item in items:
+            p, d = divmod(item, stride)
+            if d < len(rhs_of[p]):
+                transitions[rhs_of[p][d]].append(item + 1)
+            else:
+                reductions.append(p)
+
+        row = defaultdict(list)
+        for symbol in sorted(transitions):
+            target = self._register(self._encode(transitions[symbol]))
+            row[symbol].append(str(target) if symbol in non_terminals else f"s{target}")
+        for p in sorted(reductions):
+            if p == 0:
+                row['$'].append("acc")
+                continue
+            for symbol in sorted(self.follow_sets.get(self.lhs[p], ())):
+                row[symbol].append(f"r{p}")
+        return dict(row)
+
+    def rows(self):
+        """Yield (state, row) pairs in state order while building the table.
+        A new call resumes after the last state already yielded, so a
+        partially consumed build can be finished by table().
+        """
+        if self.state_count == 0:
+            self._register(self._encode([0]))
+        try:
+            while self._next_state < self.state_count:
+                state = self._next_state
+                row = self._expand(state)
+                encoded = json.dumps(row, separators=(',', ':'))
+                self._row_buffer.append((state, encoded))
+                self._row_bytes += len(encoded) + self.ENTRY_OVERHEAD
+                self._buffered_bytes += len(encoded) + self.ENTRY_OVERHEAD
+                self._next_state = state + 1
+                if len(self._row_buffer) >= self.ROW_BATCH:
+                    self._flush_rows()
+                if self._buffered_bytes > self.memory_limit:
+                    self._spill()
+                yield state, row
+            self._flush_rows()
+            self.connection.commit()
+            self.finished = True
+        finally:
+            self.peak_rss_mb = peak_rss_mb()
+
+    def table(self):
+        """Consume rows() if needed and return the disk-backed parsing table."""
+        if not self.finished:
+            for _ in self.rows():
+                pass
+        return DiskParsingTable(self.connection, self.state_count)
+
+    def close(self):
+        self.connection.close()
+        if self._temp_dir is not None:
+            shutil.rmtree(self._temp_dir, ignore_errors=True)
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MiB, or None if unavailable."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes.
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+# --------------------------
+# Table-Driven Parsing
+# --------------------------
+
+class ParseError(Exception):
+    """Raised when the driver reaches an empty or conflicting table entry."""
+
+    def __init__(self, message, position=None, state=None, token=None, expected=()):
+        super().__init__(message)
+        self.position = position
+        self.state = state
+        self.token = token
+        self.expected = tuple(expected)
+
+
+class CompiledTable:
+    """Integer-coded view of a parsing table for the driver.
+    Shift to state N is stored as N and reduce by production N as ~N, so the
+    accept entry (a reduction by the augmented production 0) is ~0. Cells with
+    more than one action are left out of `actions` and listed in `conflicts`.
+    `expected` and `recovery` hold the per-state error-reporting and
+    synchronization data used by panic-mode recovery.
+    """
+    __slots__ = ('actions', 'gotos', 'conflicts', 'prod_lhs', 'prod_len',
+                 'expected', 'recovery', 'sync_tokens')
+
+    def __init__(self, actions, gotos, conflicts, prod_lhs, prod_len,
+                 expected, recovery, sync_tokens):
+        self.actions = actions
+        self.gotos = gotos
+        self.conflicts = conflicts
+        self.prod_lhs = prod_lhs
+        self.prod_len = prod_len
+        self.expected = expected
+        self.recovery = recovery
+        self.sync_tokens = sync_tokens
+
+
+def encode_action(action):
+    """Encode a table entry such as 's4', 'r2' or 'acc' as an integer code."""
+    if action == 'acc':
+        return ~0
+    if action[0] == 's':
+        return int(action[1:])
+    return ~int(action[1:])
+
+
+def compile_parsing_table(parsing_table, augmented_grammar, non_terminals, follow_sets):
+    """Compile the parsing table produced by construct_parsing_table()."""
+    actions = []
+    gotos = []
+    conflicts = {}
+    for state in range(len(parsing_table)):
+        row_actions = {}
+        row_gotos = {}
+        for symbol, acts in parsing_table[state].items():
+            if not acts:
+                continue
+            if symbol in non_terminals:
+                row_gotos[symbol] = int(acts[0])
+            elif len(acts) == 1:
+                row_actions[symbol] = encode_action(acts[0])
+            else:
+                conflicts[(state, symbol)] = [encode_action(a) for a in acts]
+        actions.append(row_actions)
+        gotos.append(row_gotos)
+    prod_lhs = [nt for nt, _ in augmented_grammar]
+    prod_len = [len(rhs) for _, rhs in augmented_grammar]
+    expected, recovery, sync_tokens = compute_recovery_sets(actions, gotos, conflicts, follow_sets)
+    return CompiledTable(actions, gotos, conflicts, prod_lhs, prod_len,
+                         expected, recovery, sync_tokens)
+
+
+def compute_recovery_sets(actions, gotos, conflicts, follow_sets):
+    """Precompute per-state expected tokens and panic-mode synchronization sets.
+    recovery[state] maps a token to (goto state, A) for resuming as if a
+    phrase for non-terminal A, which has a goto from `state`, ended just
+    before that token. Only tokens in FOLLOW(A) that the goto target can act on are kept, so
+    resuming there always makes progress.
+    Returns: expected, recovery, sync_tokens.
+    """
+    conflict_symbols = defaultdict(set)
+    for state, symbol in conflicts:
+        conflict_symbols[state].add(symbol)
+
+    expected = []
+    recovery = []
+    sync_tokens = set()
+    for state in range(len(actions)):
+        expected.append(tuple(sorted(set(actions[state]) | conflict_symbols[state])))
+        row = {}
+        for nt in sorted(gotos[state]):
+            target = gotos[state][nt]
+            for token in follow_sets.get(nt, ()):
+                if token not in row and (token in actions[target] or token in conflict_symbols[target]):
+                    row[token] = (target, nt)
+        recovery.append(row)
+        sync_tokens.update(row)
+    return expected, recovery, sync_tokens
+
+
+# Lookahead standing in for a literal '$' read from the input. '$' is the
+# table's end-of-input column, so the input itself can never supply it.
+_STRAY_END_MARKER = object()
+
+
+def _lookaheads(tokens):
+    """Yield (lookahead, lexeme) for each token, then ('$', '$') once the
+    input is exhausted. A '$' in the input becomes _STRAY_END_MARKER, which
+    no table cell matches, so it is reported as an ordinary syntax error.
+    """
+    for token in tokens:
+        if isinstance(token, tuple):
+            lookahead, lexeme = token
+        else:
+            lookahead = lexeme = token
+        if lookahead == '$':
+            lookahead = _STRAY_END_MARKER
+        yield lookahead, lexeme
+    yield '$', '$'
+
+
+def unexpected_token(lookahead, position, state, expected):
+    """Build the ParseError for a lookahead produced by _lookaheads()."""
+    if lookahead is _STRAY_END_MARKER:
+        token, note = '$', " ('$' is reserved for the end of input)"
+    else:
+        token, note = lookahead, ""
+    return ParseError(
+        f"Unexpected '{token}' at token {position}{note}; expected one of: {', '.join(expected)}",
+        position, state, token, expected)
+
+
+def syntax_error(table, state, token, position):
+    """Build the ParseError reported for `token` in `state`."""
+    return unexpected_token(token, position, state, table.expected[state])
+
+
+class ParseTreeStore:
+    """Parse-tree nodes kept in parallel arrays indexed by node id.
+    Leaves have production -1 and carry the token lexeme as their value;
+    interior nodes record the production they were reduced by, and nodes
+    standing in for input skipped by error recovery have production -2. The children
+    of each node sit contiguously in one flat array, so a node costs a few
+    machine integers plus one value slot regardless of its arity.
+    """
+    __slots__ = ('symbol_names', '_symbol_ids', 'symbols', 'productions',
+                 'child_start', 'child_count', 'children', 'values')
+
+    def __init__(self):
+        self.symbol_names = []
+        self._symbol_ids = {}
+        self.symbols = array('i')
+        self.productions = array('i')
+        self.child_start = array('q')
+        self.child_count = array('i')
+        self.children = array('q')
+        self.values = []
+
+    def __len__(self):
+        return len(self.symbols)
+
+    def _intern(self, symbol):
+        symbol_id = self._symbol_ids.get(symbol)
+        if symbol_id is None:
+            symbol_id = self._symbol_ids[symbol] = len(self.symbol_names)
+            self.symbol_names.append(symbol)
+        return symbol_id
+
+    def add_leaf(self, symbol, value):
+        """Add a terminal node and return its id."""
+        return self.add_node(symbol, -1, (), value)
+
+    def add_node(self, symbol, production, children, value=None):
+        """Add a node with the given child node ids and return its id."""
+        node = len(self.symbols)
+        self.symbols.append(self._intern(symbol))
+        self.productions.append(production)
+        self.child_start.append(len(self.children))
+        self.child_count.append(len(children))
+        self.children.extend(children)
+        self.values.append(value)
+        return node
+
+    def symbol(self, node):
+        return self.symbol_names[self.symbols[node]]
+
+    def production(self, node):
+        return self.productions[node]
+
+    def value(self, node):
+        return self.values[node]
+
+    def child_ids(self, node):
+        start = self.child_start[node]
+        return self.children[start:start + self.child_count[node]]
+
+
+def parse_tokens(tokens, table, actions=None, build_tree=False, errors=None):
+    """Run the SLR driver over an iterable of tokens using a CompiledTable.
+    Tokens are terminal names or (terminal, lexeme) pairs; the end marker '$'
+    is appended automatically once the input runs out, so generators can be
+    parsed as they stream. A '$' inside the input is a syntax error.
+    When build_tree is set or semantic actions are given, each reduction by
+    production N calls actions[N](store, children) if registered, which must
+    return a node id, and otherwise adds a default node to a ParseTreeStore.
+    Syntax errors raise ParseError unless an `errors` list is given; then each
+    error is appended to it and parsing resumes in panic mode using the
+    table's precomputed synchronization sets, so one pass reports them all.
+    Returns: (store, root), or (None, None) when no tree is built or the
+    input ended before recovery could resynchronize.
+    """
+    action_rows = table.actions
+    goto_rows = table.gotos
+    recovery = table.recovery
+    sync_tokens = table.sync_tokens
+    prod_lhs = table.prod_lhs
+    prod_len = table.prod_len
+    actions = actions or {}
+    store = ParseTreeStore() if (build_tree or actions) else None
+
+    states = [0]
+    values = []
+    recovering = False
+    token_iter = _lookaheads(tokens)
+    position = 0
+    lookahead, lexeme = next(token_iter)
+
+    while True:
+        state = states[-1]
+        code = action_rows[state].get(lookahead)
+        if code is None:
+            if (state, lookahead) in table.conflicts:
+                raise ParseError(
+                    f"Conflicting actions in state {state} on '{lookahead}'",
+                    position, state, lookahead, table.expected[state])
+            if errors is None:
+                raise syntax_error(table, state, lookahead, position)
+            # Report once per error; failing again before any shift means the
+            # last resynchronization point was wrong, so drop the token.
+            if not recovering:
+                errors.append(syntax_error(table, state, lookahead, position))
+            elif lookahead == '$':
+                return store, None
+            else:
+                lookahead = None
+            recovering = True
+            while True:
+                if lookahead in sync_tokens:
+                    depth = len(states) - 1
+                    while depth >= 0 and lookahead not in recovery[states[depth]]:
+                        depth -= 1
+                    if depth >= 0:
+                        break
+                if lookahead == '$':
+                    return store, None
+                position += 1
+                lookahead, lexeme = next(token_iter)
+            target, nt = recovery[states[depth]][lookahead]
+            del states[depth + 1:]
+            states.append(target)
+            if store is not None:
+                del values[depth:]
+                values.append(store.add_node(nt, -2, ()))
+            continue
+        if code >= 0:
+            recovering = False
+            states.append(code)
+            if store is not None:
+                values.append(store.add_leaf(lookahead, lexeme))
+            position += 1
+            lookahead, lexeme = next(token_iter)
+        elif code == ~0:
+            if store is None:
+                return None, None
+            return store, values[-1]
+        else:
+            prod = ~code
+            n = prod_len[prod]
+            if n:
+                del states[-n:]
+            lhs = prod_lhs[prod]
+            states.append(goto_rows[states[-1]][lhs])
+            if store is not None:
+                if n:
+                    children = values[-n:]
+                    del values[-n:]
+                else:
+                    children = []
+                handler = actions.get(prod)
+                if handler is not None:
+                    values.append(handler(store, children))
+                else:
+                    values.append(store.add_node(lhs, prod, children))
+
+
+# --------------------------
+# Generalized LR Parsing
+# --------------------------
+
+class GSSNode:
+    """Graph-structured stack node: an LR state at an input position.
+    Each edge is (predecessor node, forest node for the symbol between them).
+    """
+    __slots__ = ('state', 'level', 'edges')
+
+    def __init__(self, state, level):
+        self.state = state
+        self.level = level
+        self.edges = []
+
+
+class ParseForest:
+    """Shared packed parse forest built by glr_parse().
+    Nodes are identified by (symbol, start, end) and stored in parallel
+    columns. Terminal nodes carry their lexeme; every other node keeps a list
+    of packed alternatives (production, child node ids), so ambiguity stays
+    local to the node where it occurs.
+    """
+    __slots__ = ('symbols', 'starts', 'ends', 'values', 'families', '_index', 'root')
+
+    def __init__(self):
+        self.symbols = []
+        self.starts = array('q')
+        self.ends = array('q')
+        self.values = []
+        self.families = []
+        self._index = {}
+        self.root = None
+
+    def __len__(self):
+        return len(self.symbols)
+
+    def node(self, symbol, start, end):
+        """Return the id of the node for (symbol, start, end), adding it if new."""
+        key = (symbol, start, end)
+        node = self._index.get(key)
+        if node is None:
+            node = self._index[key] = self._add(symbol, start, end, None)
+        return node
+
+    def leaf(self, symbol, position, value):
+        """Add the terminal node for the token at `position`; one per position."""
+        return self._add(symbol, position, position + 1, value)
+
+    def _add(self, symbol, start, end, value):
+        node = len(self.symbols)
+        self.symbols.append(symbol)
+        self.starts.append(start)
+        self.ends.append(end)
+        self.values.append(value)
+        self.families.append([])
+        return node
+
+    def add_family(self, node, production, children):
+        family = (production, children)
+        if family not in self.families[node]:
+            self.families[node].append(family)
+
+    def is_ambiguous(self):
+        return any(len(families) > 1 for families in self.families)
+
+    def count_trees(self, node=None):
+        """Number of distinct trees below a node; inf if the forest has a cycle."""
+        node = self.root if node is None else node
+        counts = {}
+        on_path = set()
+        stack = [(node, False)]
+        while stack:
+            current, expanded = stack.pop()
+            if current in counts:
+                continue
+            if expanded:
+                on_path.discard(current)
+                if not self.families[current]:
+                    counts[current] = 1
+                    continue
+                total = 0
+                for _, children in self.families[current]:
+                    product = 1
+                    for child in children:
+                        product *= counts[child]
+                    total += product
+                counts[current] = total
+                continue
+            if current in on_path:
+                return float('inf')
+            on_path.add(current)
+            stack.append((current, True))
+            for _, children in self.families[current]:
+                for child in children:
+                    if child not in counts:
+                        if child in on_path:
+                            return float('inf')
+                        stack.append((child, False))
+        return counts[node]
+
+    def first_tree(self):
+        """Extract one derivation as a ParseTreeStore; returns (store, root).
+        At each node the first alternative not leading back into the current
+        path is taken, so cyclic grammars still yield a finite tree.
+        """
+        store = ParseTreeStore()
+        built = {}
+        on_path = set()
+        stack = [(self.root, None)]
+        while stack:
+            node, family = stack.pop()
+            if family is None:
+                if not self.families[node]:
+                    built[node] = store.add_leaf(self.symbols[node], self.values[node])
+                    continue
+                family = next((f for f in self.families[node]
+                               if not any(child in on_path for child in f[1])), None)
+                if family is None:
+                    raise ValueError(f"No acyclic derivation for '{self.symbols[node]}'")
+                on_path.add(node)
+                stack.append((node, family))
+                for child in reversed(family[1]):
+                    if child not in built:
+                        stack.append((child, None))
+                continue
+            on_path.discard(node)
+            production, children = family
+            built[node] = store.add_node(self.symbols[node], production,
+                                         [built[child] for child in children])
+        return store, built[self.root]
+
+
+def glr_parse(tokens, table):
+    """Parse with a generalized LR driver that follows every action in a cell.
+    Conflicting cells fork the graph-structured stack and equal derivations
+    are packed into a shared ParseForest, so ambiguous and non-SLR grammars
+    parse in polynomial time. While the stack is a single path and the cell
+    holds one action, reductions follow the plain LR path directly.
+    Tokens are accepted in the same forms as parse_tokens().
+    Returns: ParseForest with `root` set to the start symbol node.
+    """
+    action_rows = table.actions
+    goto_rows = table.gotos
+    conflicts = table.conflicts
+    prod_lhs = table.prod_lhs
+    prod_len = table.prod_len
+    forest = ParseForest()
+
+    def cell(state, lookahead):
+        codes = conflicts.get((state, lookahead))
+        if codes is not None:
+            return codes
+        code = action_rows[state].get(lookahead)
+        return () if code is None else (code,)
+
+    def paths(node, length, link):
+        """Yield (end node, child forest nodes) for paths of `length` edges,
+        restricted to those using `link` when one is given."""
+        stack = [(node, length, (), link is None)]
+        while stack:
+            current, remaining, children, used = stack.pop()
+            if remaining == 0:
+                if used:
+                    yield current, children
+                continue
+            for edge in current.edges:
+                stack.append((edge[0], remaining - 1, (edge[1],) + children, used or edge is link))
+
+    level_nodes = {0: GSSNode(0, 0)}
+    position = 0
+    token_iter = _lookaheads(tokens)
+    while True:
+        lookahead, lexeme = next(token_iter)
+
+        # Deterministic fast path: while there is one stack top whose cell
+        # holds a single reduction over a linear stack, reduce as plain LR.
+        # Anything else, including revisiting a state at this level, is left
+        # to the general phase, which merges nodes.
+        fast = next(iter(level_nodes.values())) if len(level_nodes) == 1 else None
+        while fast is not None:
+            if (fast.state, lookahead) in conflicts:
+                fast = None
+                break
+            code = action_rows[fast.state].get(lookahead)
+            if code is None or code >= 0 or code == ~0:
+                break
+            prod = ~code
+            children = []
+            bottom = fast
+            for _ in range(prod_len[prod]):
+                if len(bottom.edges) != 1:
+                    break
+                bottom, child = bottom.edges[0]
+                children.append(child)
+            else:
+                lhs = prod_lhs[prod]
+                target = goto_rows[bottom.state][lhs]
+                if target not in level_nodes:
+                    reduced = forest.node(lhs, bottom.level, position)
+                    forest.add_family(reduced, prod, tuple(reversed(children)))
+                    fast = level_nodes[target] = GSSNode(target, position)
+                    fast.edges.append((bottom, reduced))
+                    continue
+            fast = None
+
+        if fast is not None:
+            # Only the final top can shift, accept or report the error.
+            active = (fast,)
+        else:
+            # General reduce phase over every node at this level.
+            worklist = deque()
+            for node in level_nodes.values():
+                for code in cell(node.state, lookahead):
+                    if code < 0 and code != ~0:
+                        worklist.append((node, ~code, None))
+            while worklist:
+                node, prod, link = worklist.popleft()
+                lhs = prod_lhs[prod]
+                for bottom, children in list(paths(node, prod_len[prod], link)):
+                    reduced = forest.node(lhs, bottom.level, position)
+                    forest.add_family(reduced, prod, children)
+                    target = goto_rows[bottom.state][lhs]
+                    goal = level_nodes.get(target)
+                    if goal is None:
+                        goal = level_nodes[target] = GSSNode(target, position)
+                        goal.edges.append((bottom, reduced))
+                        for code in cell(target, lookahead):
+                            if code < 0 and code != ~0:
+                                worklist.append((goal, ~code, None))
+                    elif not any(edge[0] is bottom for edge in goal.edges):
+                        edge = (bottom, reduced)
+                        goal.edges.append(edge)
+                        # Reductions already done at this level may now have
+                        # extra paths through the new edge.
+                        for other in list(level_nodes.values()):
+                            for code in cell(other.state, lookahead):
+                                if code < 0 and code != ~0 and prod_len[~code]:
+                                    worklist.append((other, ~code, edge))
+            active = list(level_nodes.values())
+
+        if lookahead == '$':
+            for node in active:
+                if ~0 in cell(node.state, '$'):
+                    forest.root = node.edges[0][1]
+                    return forest
+
+        # Shift phase.
+        next_nodes = {}
+        leaf = None
+        for node in active:
+            for code in cell(node.state, lookahead):
+                if code >= 0:
+                    if leaf is None:
+                        leaf = forest.leaf(lookahead, position, lexeme)
+                    top = next_nodes.get(code)
+                    if top is None:
+                        top = next_nodes[code] = GSSNode(code, position + 1)
+                    top.edges.append((node, leaf))
+        if not next_nodes:
+            expected = sorted({symbol for node in active
+                               for symbol in table.expected[node.state]})
+            raise unexpected_token(lookahead, position, None, expected)
+        level_nodes = next_nodes
+        position += 1
+
+
 # --------------------------
 # Formatting Functions for Display
 # --------------------------
 
+def table_header(terminals, non_terminals):
+    """Column order used for display and export: terminals, then non-terminals."""
+    return sorted(terminals) + sorted(non_terminals)
+
+
+def table_cells(parsing_table, header):
+    """Compact view of the non-empty cells of a parsing table.
+    Returns: rows, cols (int arrays) and texts, one entry per non-empty cell.
+    """
+    column_index = {symbol: i for i, symbol in enumerate(header)}
+    rows = array('i')
+    cols = array('i')
+    texts = []
+    for state in range(len(parsing_table)):
+        for symbol, acts in parsing_table[state].items():
+            if acts:
+                rows.append(state)
+                cols.append(column_index[symbol])
+                texts.append('/'.join(acts))
+    return rows, cols, texts
+
+
 def format_parsing_table(parsing_table, canonical_collection, terminals, non_terminals):
     """Format the parsing table into a DataFrame (without an extra 'State' column)."""
-    sorted_terminals = sorted(terminals)
-    sorted_non_terminals = sorted(non_terminals)
-    header = sorted_terminals + sorted_non_terminals
-    rows = {}
-    for state in range(len(canonical_collection)):
-        row = []
-        for terminal in sorted_terminals:
-            acts = parsing_table[state].get(terminal, [])
-            row.append('/'.join(acts) if acts else '')
-        for nt in sorted_non_terminals:
-            acts = parsing_table[state].get(nt, [])
-            row.append('/'.join(acts) if acts else '')
-        rows[state] = row
-    return pd.DataFrame.from_dict(rows, orient='index', columns=header)
+    header = table_header(terminals, non_terminals)
+    rows, cols, texts = table_cells(parsing_table, header)
+    grid = np.full((len(canonical_collection), len(header)), '', dtype=object)
+    if texts:
+        grid[np.asarray(rows), np.asarray(cols)] = texts
+    return pd.DataFrame(grid, columns=header)
 
 def get_productions(augmented_grammar):
     """Return a list of productions (excluding the augmented production) as strings."""
@@ -541,6 +1440,117 @@ def format_lr_items(canonical_collection):
         formatted.append((i, state_items))
     return formatted
 
+def format_parse_tree(store, root):
+    """Format a parse tree as indented text, one node per line."""
+    lines = []
+    stack = [(root, 0)]
+    while stack:
+        node, depth = stack.pop()
+        label = store.symbol(node)
+        if store.production(node) == -1 and store.value(node) != label:
+            label = f"{label} ({store.value(node)})"
+        elif store.production(node) == -2:
+            label = f"{label} <error>"
+        lines.append("  " * depth + label)
+        for child in reversed(store.child_ids(node)):
+            stack.append((child, depth + 1))
+    return "\n".join(lines)
+
+# --------------------------
+# Table Export
+# --------------------------
+
+# Cells per export chunk; wide tables get proportionally fewer rows.
+EXPORT_CHUNK_CELLS = 256 * 1024
+
+EXPORT_FORMATS = {
+    'csv': 'text/csv',
+    'json': 'application/json',
+    'parquet': 'application/vnd.apache.parquet',
+}
+
+
+def iter_table_chunks(parsing_table, header, chunk_cells=EXPORT_CHUNK_CELLS):
+    """Yield (first state, rows of cell strings) covering about chunk_cells cells each."""
+    column_index = {symbol: i for i, symbol in enumerate(header)}
+    chunk_rows = max(1, chunk_cells // max(1, len(header)))
+    chunk = []
+    first = 0
+    for state in range(len(parsing_table)):
+        row = [''] * len(header)
+        for symbol, acts in parsing_table[state].items():
+            if acts:
+                row[column_index[symbol]] = '/'.join(acts)
+        chunk.append(row)
+        if len(chunk) == chunk_rows:
+            yield first, chunk
+            first, chunk = state + 1, []
+    if chunk:
+        yield first, chunk
+
+
+def export_parsing_table(parsing_table, terminals, non_terminals, fmt, out, chunk_cells=EXPORT_CHUNK_CELLS):
+    """Stream the parsing table to the binary file object `out` in chunks.
+    CSV matches DataFrame.to_csv() of format_parsing_table(); JSON maps each
+    state to its non-empty cells only, in column order; Parquet writes one row
+    group per chunk and needs pyarrow. The state column is unnamed in CSV and
+    Parquet, since no grammar symbol can be empty. Only one chunk of rows is
+    held in memory at a time.
+    """
+    header = table_header(terminals, non_terminals)
+    chunks = iter_table_chunks(parsing_table, header, chunk_cells)
+    if fmt == 'csv':
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator='\n')
+        writer.writerow([''] + header)
+        for first, rows in chunks:
+            writer.writerows([state, *row] for state, row in enumerate(rows, first))
+            out.write(buffer.getvalue().encode())
+            buffer.seek(0)
+            buffer.truncate()
+    elif fmt == 'json':
+        out.write(b'{')
+        for first, rows in chunks:
+            out.write(''.join(
+                f'{"," if state else ""}"{state}":'
+                + json.dumps({symbol: text for symbol, text in zip(header, row) if text}, separators=(',', ':'))
+                for state, row in enumerate(rows, first)).encode())
+        out.write(b'}')
+    elif fmt == 'parquet':
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ValueError("Parquet export requires the 'pyarrow' package")
+        schema = pa.schema([('', pa.int64())] + [(symbol, pa.string()) for symbol in header])
+        with pq.ParquetWriter(out, schema) as writer:
+            for first, rows in chunks:
+                columns = [pa.array(range(first, first + len(rows)), pa.int64())]
+                columns += [pa.array(column, pa.string()) for column in zip(*rows)]
+                writer.write_table(pa.Table.from_arrays(columns, schema=schema))
+    else:
+        raise ValueError(f"Unknown export format: {fmt}")
+
+
+def available_export_formats():
+    """EXPORT_FORMATS without the formats whose optional packages are missing."""
+    formats = dict(EXPORT_FORMATS)
+    if importlib.util.find_spec('pyarrow') is None:
+        del formats['parquet']
+    return formats
+
+
+def download_exporter(parsing_table, terminals, non_terminals, fmt):
+    """Return the deferred callable behind a download button.
+    Streamlit runs it only when the button is clicked and accepts bytes, not
+    arbitrary file objects, so the export is returned as bytes.
+    """
+    def export():
+        out = io.BytesIO()
+        export_parsing_table(parsing_table, terminals, non_terminals, fmt, out)
+        return out.getvalue()
+    return export
+
 # --------------------------
 # Main Function (Enhanced Streamlit UI)
 # --------------------------
@@ -631,7 +1641,7 @@ F -> ( E ) | id
             """, unsafe_allow_html=True)
             
             # Create tabs with improved styling
-            tab1, tab2, tab3, tab4 = st.tabs(["📊 Grammar Analysis", "📝 Productions", "🔍 LR(0) Items", "📋 Parsing Table"])
+            tab1, tab2, tab3, tab4, tab5 = st.tabs(["📊 Grammar Analysis", "📝 Productions", "🔍 LR(0) Items", "📋 Parsing Table", "🧪 Parse Input"])
             
             with tab1:
                 st.markdown("""
@@ -776,11 +1786,19 @@ F -> ( E ) | id
                 parsing_table_df = format_parsing_table(parsing_table, canonical_collection, terminals, non_terminals)
                 st.dataframe(parsing_table_df, use_container_width=True)
                 
-                # Add download button for the parsing table
-                csv = parsing_table_df.to_csv(index=True)
-                b64 = base64.b64encode(csv.encode()).decode()
-                href = f'<a href="data:file/csv;base64,{b64}" download="parsing_table.csv" class="download-btn">📥 Download Parsing Table</a>'
-                st.markdown(href, unsafe_allow_html=True)
+                # Download buttons stream the export only when clicked
+                export_formats = available_export_formats()
+                download_columns = st.columns(len(export_formats))
+                for column, (fmt, mime) in zip(download_columns, export_formats.items()):
+                    with column:
+                        st.download_button(
+                            f"📥 Download {fmt.upper()}",
+                            data=download_exporter(parsing_table, terminals, non_terminals, fmt),
+                            file_name=f"parsing_table.{fmt}",
+                            mime=mime,
+                            key=f"download_{fmt}",
+                            use_container_width=True
+                        )
                 
                 st.markdown("""
                 <div style="margin-top: 20px;">
@@ -795,8 +1813,54 @@ F -> ( E ) | id
                 """, unsafe_allow_html=True)
                 
                 st.markdown("</div>", unsafe_allow_html=True)
-            
-        
+
+            with tab5:
+                st.markdown("""
+                <h2 style="border-bottom: 2px solid var(--primary-color); padding-bottom: 8px;">Parse Input</h2>
+                """, unsafe_allow_html=True)
+
+                input_string = st.text_input(
+                    "Enter an input string (separate tokens with spaces):",
+                    value="id + id * id",
+                    key="parse_input"
+                )
+
+                compiled_table = compile_parsing_table(parsing_table, augmented_grammar, non_terminals, follow_sets)
+                try:
+                    parse_errors = []
+                    if compiled_table.conflicts:
+                        # Conflicting cells: parse with GLR and show one derivation.
+                        forest = glr_parse(input_string.split(), compiled_table)
+                        store, root = forest.first_tree()
+                        st.info(f"The table has conflicts, so the input was parsed with a GLR driver: "
+                                f"{forest.count_trees()} derivation(s) found.")
+                    else:
+                        store, root = parse_tokens(input_string.split(), compiled_table,
+                                                   build_tree=True, errors=parse_errors)
+                    if parse_errors:
+                        st.markdown(f"""
+                        <div class="error-box">
+                            <h4 style="margin-top: 0;">❌ Input Rejected ({len(parse_errors)} error(s))</h4>
+                        </div>
+                        """, unsafe_allow_html=True)
+                        for error in parse_errors:
+                            st.error(str(error))
+                    else:
+                        st.markdown("""
+                        <div class="success-box">
+                            <h4 style="margin-top: 0;">✅ Input Accepted</h4>
+                        </div>
+                        """, unsafe_allow_html=True)
+                    if root is not None:
+                        st.code(format_parse_tree(store, root), language=None)
+                except ParseError as e:
+                    st.markdown("""
+                    <div class="error-box">
+                        <h4 style="margin-top: 0;">❌ Input Rejected</h4>
+                    </div>
+                    """, unsafe_allow_html=True)
+                    st.error(str(e))
+
         except Exception as e:
             st.markdown("""
             <div class="error-box">
@@ -0,0 +1,124 @@
+"""
+Benchmark parsing-table formatting and export on a synthetic grammar:
+
+    python benchmark.py --non-terminals 2000
+
+Reports wall time and peak traced Python memory (tracemalloc) for building
+the DataFrame and for each export format, next to the previous approach of
+a row-by-row DataFrame and an in-memory CSV inlined as base64. Memory held
+by pyarrow's own allocator is not traced.
+"""
+
+import argparse
+import base64
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+
+from app import (
+    parse_grammar,
+    process_grammar,
+    compute_first_sets,
+    compute_follow_sets,
+    BoundedTableBuilder,
+    EXPORT_FORMATS,
+    export_parsing_table,
+    format_parsing_table,
+    peak_rss_mb,
+)
+
+
+def synthetic_grammar(non_terminals, terminals, seed):
+    """Chain-shaped random grammar whose table grows with `non_terminals`."""
+    rng = random.Random(seed)
+    lines = []
+    for i in range(non_terminals):
+        alternatives = []
+        for _ in range(3):
+            symbols = [f"N{rng.randint(i + 1, non_terminals)}" if rng.random() < 0.5
+                       else f"t{rng.randrange(terminals)}"
+                       for _ in range(rng.randint(1, 4))]
+            alternatives.append(' '.join(symbols))
+        lines.append(f"N{i} -> {' | '.join(alternatives)}")
+    lines.append(f"N{non_terminals} -> t0")
+    return '\n'.join(lines)
+
+
+def legacy_format(parsing_table, state_count, terminals, non_terminals):
+    sorted_terminals = sorted(terminals)
+    sorted_non_terminals = sorted(non_terminals)
+    rows = {}
+    for state in range(state_count):
+        row = []
+        for symbol in sorted_terminals + sorted_non_terminals:
+            acts = parsing_table[state].get(symbol, [])
+            row.append('/'.join(acts) if acts else '')
+        rows[state] = row
+    return pd.DataFrame.from_dict(rows, orient='index', columns=sorted_terminals + sorted_non_terminals)
+
+
+def measure(label, fn):
+    """Time one untraced run, then take the memory peak from a traced run."""
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<28} {elapsed:>9.3f} s {peak / (1024 * 1024):>10.1f} MiB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark parsing-table formatting and export.")
+    parser.add_argument('--non-terminals', type=int, default=1000)
+    parser.add_argument('--terminals', type=int, default=60)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    grammar = parse_grammar(synthetic_grammar(args.non_terminals, args.terminals, args.seed))
+    start_symbol, terminals, non_terminals, augmented_grammar = process_grammar(grammar)
+    first_sets = compute_first_sets(grammar, terminals, non_terminals)
+    follow_sets = compute_follow_sets(grammar, non_terminals, start_symbol, first_sets)
+    builder = BoundedTableBuilder(terminals, non_terminals, augmented_grammar, follow_sets)
+    disk_table = builder.table()
+    parsing_table = {state: disk_table[state] for state in range(len(disk_table))}
+    builder.close()
+    state_count = len(parsing_table)
+    print(f"{state_count} states x {len(terminals) + len(non_terminals)} symbols\n")
+    print(f"{'step':<28} {'time':>11} {'peak traced':>14}")
+
+    states = range(state_count)
+    measure("DataFrame (row by row)", lambda: legacy_format(parsing_table, state_count, terminals, non_terminals))
+    measure("DataFrame (vectorized)", lambda: format_parsing_table(parsing_table, states, terminals, non_terminals))
+
+    def legacy_export():
+        df = legacy_format(parsing_table, state_count, terminals, non_terminals)
+        csv = df.to_csv(index=True)
+        b64 = base64.b64encode(csv.encode()).decode()
+        return f'<a href="data:file/csv;base64,{b64}" download="parsing_table.csv">Download</a>'
+    measure("CSV inline base64 (legacy)", legacy_export)
+
+    with tempfile.TemporaryDirectory() as directory:
+        for fmt in EXPORT_FORMATS:
+            path = os.path.join(directory, f"parsing_table.{fmt}")
+
+            def export():
+                with open(path, 'wb') as out:
+                    export_parsing_table(parsing_table, terminals, non_terminals, fmt, out)
+            try:
+                measure(f"{fmt.upper()} streamed export", export)
+            except ValueError as e:
+                print(f"{fmt.upper() + ' streamed export':<28} skipped: {e}")
+                continue
+            print(f"{'':<28} {os.path.getsize(path) / (1024 * 1024):>9.1f} MiB on disk")
+
+    print(f"\nPeak RSS: {peak_rss_mb():.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
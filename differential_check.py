@@ -0,0 +1,318 @@
+"""
+Differential correctness harness for optimized table engines.
+
+Treats the straightforward implementations in app.py (compute_first_sets,
+compute_follow_sets, build_canonical_collection and construct_parsing_table)
+as the reference oracle, then checks every registered backend against them
+on edge-case grammars and on randomized grammars until a time budget runs out:
+
+    python differential_check.py --seconds 30 --seed 1
+
+States may be numbered differently by a backend; tables and collections are
+compared after mapping states through the (deterministic) LR(0) transitions
+from state 0. On the edge-case grammars, the download button exports are
+also checked against format_parsing_table(). Any mismatch is printed with the grammar that triggered it and
+the process exits with status 1.
+"""
+
+import argparse
+import io
+import json
+import random
+import sys
+import time
+
+import pandas as pd
+
+from app import (
+    parse_grammar,
+    process_grammar,
+    compute_first_sets,
+    compute_follow_sets,
+    build_canonical_collection,
+    build_canonical_collection_parallel,
+    construct_parsing_table,
+    BoundedTableBuilder,
+    available_export_formats,
+    download_exporter,
+    format_parsing_table,
+)
+
+
+# --------------------------
+# Backends
+# --------------------------
+
+def bounded_table(grammar, start_symbol, terminals, non_terminals, augmented_grammar, follow_sets):
+    builder = BoundedTableBuilder(terminals, non_terminals, augmented_grammar, follow_sets,
+                                  memory_limit_mb=0.01)
+    try:
+        table = builder.table()
+        return {state: table[state] for state in range(len(table))}
+    finally:
+        builder.close()
+
+
+def parallel_collection(grammar, non_terminals, start_symbol):
+    # Expand every level in-process; the merge logic is what differs.
+    return build_canonical_collection_parallel(grammar, non_terminals, start_symbol,
+                                               workers=1, min_parallel=float('inf'))
+
+
+def parallel_pool_collection(grammar, non_terminals, start_symbol):
+    # Send every level, however small, through the worker pool.
+    return build_canonical_collection_parallel(grammar, non_terminals, start_symbol,
+                                               workers=2, min_parallel=1)
+
+
+# Each entry maps a name to a callable with the signature noted above it.
+# fn(grammar, terminals, non_terminals, start_symbol) -> (first_sets, follow_sets)
+SET_BACKENDS = {}
+# fn(grammar, non_terminals, start_symbol) -> (canonical_collection, goto_table)
+COLLECTION_BACKENDS = {
+    'parallel': parallel_collection,
+    'parallel-pool': parallel_pool_collection,
+}
+# fn(grammar, start_symbol, terminals, non_terminals, augmented_grammar, follow_sets) -> parsing_table
+TABLE_BACKENDS = {
+    'bounded': bounded_table,
+}
+
+
+# --------------------------
+# Grammar Generation
+# --------------------------
+
+EDGE_CASE_GRAMMARS = [
+    # Left recursion
+    "E -> E + T | T\nT -> T * F | F\nF -> ( E ) | id",
+    # Epsilon chains
+    "S -> A B c\nA -> B | #\nB -> C\nC -> # | d",
+    "S -> A\nA -> B\nB -> C\nC -> #",
+    # Nullable start symbol
+    "S -> #",
+    "S -> # | a S",
+    # Hidden left recursion through a nullable prefix
+    "S -> A S b | c\nA -> #",
+    # Unreachable symbols
+    "S -> a\nU -> b U | c",
+    "S -> a S | b\nX -> Y\nY -> X | z",
+    # Repeated alternatives
+    "S -> a | a | S b",
+    # Right recursion and mutual recursion
+    "L -> a L | a",
+    "S -> A a | b\nA -> S c | d",
+    # Classic non-SLR grammar (shift/reduce conflict)
+    "S -> L = R | R\nL -> * R | id\nR -> L",
+    # Ambiguous grammar (many conflicts)
+    "E -> E + E | E * E | id",
+]
+
+
+def random_grammar(rng):
+    """Return the text of a small random grammar."""
+    nt_count = rng.randint(1, 6)
+    non_terminals = [chr(ord('A') + i) for i in range(nt_count)]
+    terminals = [chr(ord('a') + i) for i in range(rng.randint(1, 5))]
+    lines = []
+    for nt in non_terminals:
+        alternatives = []
+        for _ in range(rng.randint(1, 4)):
+            if rng.random() < 0.15:
+                alternatives.append('#')
+                continue
+            length = rng.randint(1, 4)
+            symbols = [rng.choice(non_terminals) if rng.random() < 0.4 else rng.choice(terminals)
+                       for _ in range(length)]
+            # Bias towards left recursion.
+            if rng.random() < 0.15:
+                symbols[0] = nt
+            alternatives.append(' '.join(symbols))
+        lines.append(f"{nt} -> {' | '.join(alternatives)}")
+    return '\n'.join(lines)
+
+
+# --------------------------
+# Comparison
+# --------------------------
+
+def is_state_action(action):
+    return action[0] == 's' or action.isdigit()
+
+
+def target_state(action):
+    return int(action.lstrip('s'))
+
+
+def map_states(reference_table, candidate_table):
+    """Match candidate states to reference states by following transitions.
+    Returns: (mapping, problem) where problem describes the first mismatch.
+    """
+    mapping = {0: 0}
+    queue = [0]
+    while queue:
+        state = queue.pop()
+        other = mapping[state]
+        reference_row = {s: a for s, a in reference_table[state].items() if a}
+        candidate_row = {s: a for s, a in candidate_table[other].items() if a}
+        if reference_row.keys() != candidate_row.keys():
+            return mapping, f"state {state}/{other}: symbols differ {sorted(set(reference_row) ^ set(candidate_row))}"
+        for symbol, actions in reference_row.items():
+            reference_moves = [target_state(a) for a in actions if is_state_action(a)]
+            candidate_moves = [target_state(a) for a in candidate_row[symbol] if is_state_action(a)]
+            reference_rest = sorted(set(a for a in actions if not is_state_action(a)))
+            candidate_rest = sorted(set(a for a in candidate_row[symbol] if not is_state_action(a)))
+            if reference_rest != candidate_rest or len(reference_moves) != len(candidate_moves):
+                return mapping, f"state {state}/{other} on '{symbol}': {actions} vs {candidate_row[symbol]}"
+            for ref_target, cand_target in zip(reference_moves, candidate_moves):
+                if ref_target not in mapping:
+                    mapping[ref_target] = cand_target
+                    queue.append(ref_target)
+                elif mapping[ref_target] != cand_target:
+                    return mapping, f"state {state} on '{symbol}' reaches {ref_target} but candidate reaches {cand_target}"
+    return mapping, None
+
+
+def compare_tables(reference_table, candidate_table):
+    mapping, problem = map_states(reference_table, candidate_table)
+    if problem:
+        return problem
+    if len(mapping) != len(reference_table) or len(candidate_table) != len(reference_table):
+        return f"state counts differ: {len(reference_table)} vs {len(candidate_table)} ({len(mapping)} matched)"
+    if len(set(mapping.values())) != len(mapping):
+        return "several reference states map onto one candidate state"
+    return None
+
+
+def compare_collections(reference, candidate):
+    reference_collection, reference_goto = reference
+    candidate_collection, candidate_goto = candidate
+    if len(reference_collection) != len(candidate_collection):
+        return f"state counts differ: {len(reference_collection)} vs {len(candidate_collection)}"
+    index = {state: i for i, state in enumerate(candidate_collection)}
+    mapping = {}
+    for i, state in enumerate(reference_collection):
+        if state not in index:
+            return f"reference state {i} missing from candidate: {sorted(state)}"
+        mapping[i] = index[state]
+    translated = {(mapping[i], symbol): mapping[j] for (i, symbol), j in reference_goto.items()}
+    if translated != candidate_goto:
+        return "goto tables differ"
+    return None
+
+
+def check_grammar(grammar_input):
+    """Check every backend on one grammar. Returns a list of failure messages."""
+    grammar = parse_grammar(grammar_input)
+    start_symbol, terminals, non_terminals, augmented_grammar = process_grammar(grammar)
+    first_sets = compute_first_sets(grammar, terminals, non_terminals)
+    follow_sets = compute_follow_sets(grammar, non_terminals, start_symbol, first_sets)
+    reference_collection = build_canonical_collection(grammar, non_terminals, start_symbol)
+    reference_table = construct_parsing_table(*reference_collection, terminals, non_terminals,
+                                              augmented_grammar, grammar, follow_sets, start_symbol)
+    failures = []
+
+    for name, backend in SET_BACKENDS.items():
+        candidate_first, candidate_follow = backend(grammar, terminals, non_terminals, start_symbol)
+        if {nt: first_sets[nt] for nt in non_terminals} != {nt: candidate_first.get(nt) for nt in non_terminals}:
+            failures.append(f"[{name}] FIRST sets differ")
+        if follow_sets != candidate_follow:
+            failures.append(f"[{name}] FOLLOW sets differ")
+
+    for name, backend in COLLECTION_BACKENDS.items():
+        problem = compare_collections(reference_collection,
+                                      backend(grammar, non_terminals, start_symbol))
+        if problem:
+            failures.append(f"[{name}] {problem}")
+
+    for name, backend in TABLE_BACKENDS.items():
+        candidate_table = backend(grammar, start_symbol, terminals, non_terminals,
+                                  augmented_grammar, follow_sets)
+        problem = compare_tables(reference_table, candidate_table)
+        if problem:
+            failures.append(f"[{name}] {problem}")
+    return failures
+
+
+# --------------------------
+# Download Checks
+# --------------------------
+
+def check_downloads(grammar_input):
+    """Call each download button's callable, check that it returns bytes as
+    st.download_button requires of deferred data, and compare the export with
+    format_parsing_table(). Returns a list of failure messages.
+    """
+    grammar = parse_grammar(grammar_input)
+    start_symbol, terminals, non_terminals, augmented_grammar = process_grammar(grammar)
+    first_sets = compute_first_sets(grammar, terminals, non_terminals)
+    follow_sets = compute_follow_sets(grammar, non_terminals, start_symbol, first_sets)
+    canonical_collection, goto_table = build_canonical_collection(grammar, non_terminals, start_symbol)
+    parsing_table = construct_parsing_table(canonical_collection, goto_table, terminals, non_terminals,
+                                            augmented_grammar, grammar, follow_sets, start_symbol)
+    expected = format_parsing_table(parsing_table, canonical_collection, terminals, non_terminals)
+    failures = []
+
+    for fmt in available_export_formats():
+        data = download_exporter(parsing_table, terminals, non_terminals, fmt)()
+        if not isinstance(data, bytes):
+            failures.append(f"[download-{fmt}] callable returned {type(data).__name__}, not bytes")
+            continue
+        if fmt == 'csv':
+            matches = data.decode() == expected.to_csv(index=True)
+        elif fmt == 'json':
+            cells = {str(state): {symbol: text for symbol, text in row.items() if text}
+                     for state, row in expected.iterrows()}
+            matches = json.loads(data) == cells
+        else:
+            frame = pd.read_parquet(io.BytesIO(data)).set_index('')
+            matches = frame.fillna('').values.tolist() == expected.values.tolist()
+        if not matches:
+            failures.append(f"[download-{fmt}] export differs from format_parsing_table()")
+    return failures
+
+
+def run(seconds, seed):
+    """Run edge cases, then random grammars until the time budget is spent."""
+    rng = random.Random(seed)
+    deadline = time.monotonic() + seconds
+    cases = 0
+    failed = 0
+
+    def report(grammar_input, failures):
+        print("MISMATCH for grammar:")
+        print('\n'.join('    ' + line for line in grammar_input.split('\n')))
+        for failure in failures:
+            print(f"  {failure}")
+
+    for grammar_input in EDGE_CASE_GRAMMARS:
+        failures = check_grammar(grammar_input) + check_downloads(grammar_input)
+        cases += 1
+        if failures:
+            failed += 1
+            report(grammar_input, failures)
+
+    while time.monotonic() < deadline:
+        grammar_input = random_grammar(rng)
+        failures = check_grammar(grammar_input)
+        cases += 1
+        if failures:
+            failed += 1
+            report(grammar_input, failures)
+
+    backends = [*SET_BACKENDS, *COLLECTION_BACKENDS, *TABLE_BACKENDS]
+    print(f"Checked {cases} grammars against {len(backends)} backend(s) "
+          f"({', '.join(backends)}): {failed} mismatching")
+    return failed == 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check optimized table engines against the reference implementation.")
+    parser.add_argument('--seconds', type=float, default=10.0, help="Time budget for random grammars")
+    parser.add_argument('--seed', type=int, default=0, help="Seed for the grammar generator")
+    args = parser.parse_args()
+    sys.exit(0 if run(args.seconds, args.seed) else 1)
+
+
+if __name__ == "__main__":
+    main()
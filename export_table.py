@@ -0,0 +1,82 @@
+"""
+Command-line export of an SLR parsing table:
+
+    python export_table.py grammar.txt --format parquet -o parsing_table.parquet
+
+The grammar file uses the same syntax as the app ('-' reads stdin). Rows are
+streamed to the output in chunks; with --bounded the table is built by
+BoundedTableBuilder and read back from its disk store, so neither step holds
+the whole table in memory. --workers expands the canonical collection with
+build_canonical_collection_parallel instead.
+"""
+
+import argparse
+import sys
+
+from app import (
+    parse_grammar,
+    process_grammar,
+    compute_first_sets,
+    compute_follow_sets,
+    build_canonical_collection,
+    build_canonical_collection_parallel,
+    construct_parsing_table,
+    BoundedTableBuilder,
+    EXPORT_FORMATS,
+    export_parsing_table,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export the SLR parsing table of a grammar.")
+    parser.add_argument('grammar', help="Grammar file, or '-' for stdin")
+    parser.add_argument('-f', '--format', choices=sorted(EXPORT_FORMATS), default='csv')
+    parser.add_argument('-o', '--output', help="Output file (default: parsing_table.<format>)")
+    parser.add_argument('--bounded', action='store_true',
+                        help="Build with the memory-bounded, disk-backed builder")
+    parser.add_argument('--memory-limit-mb', type=float, default=256)
+    parser.add_argument('--workers', type=int,
+                        help="Expand the canonical collection in this many worker processes")
+    args = parser.parse_args()
+
+    if args.grammar == '-':
+        grammar_input = sys.stdin.read()
+    else:
+        with open(args.grammar) as f:
+            grammar_input = f.read()
+    grammar = parse_grammar(grammar_input)
+    if not grammar:
+        parser.error("grammar has no productions")
+    if args.bounded and args.workers:
+        parser.error("--workers cannot be combined with --bounded")
+
+    start_symbol, terminals, non_terminals, augmented_grammar = process_grammar(grammar)
+    first_sets = compute_first_sets(grammar, terminals, non_terminals)
+    follow_sets = compute_follow_sets(grammar, non_terminals, start_symbol, first_sets)
+
+    builder = None
+    if args.bounded:
+        builder = BoundedTableBuilder(terminals, non_terminals, augmented_grammar, follow_sets,
+                                      memory_limit_mb=args.memory_limit_mb)
+        parsing_table = builder.table()
+    else:
+        if args.workers:
+            canonical_collection, goto_table = build_canonical_collection_parallel(
+                grammar, non_terminals, start_symbol, workers=args.workers)
+        else:
+            canonical_collection, goto_table = build_canonical_collection(grammar, non_terminals, start_symbol)
+        parsing_table = construct_parsing_table(canonical_collection, goto_table, terminals, non_terminals,
+                                                augmented_grammar, grammar, follow_sets, start_symbol)
+
+    output = args.output or f"parsing_table.{args.format}"
+    try:
+        with open(output, 'wb') as out:
+            export_parsing_table(parsing_table, terminals, non_terminals, args.format, out)
+    finally:
+        if builder is not None:
+            builder.close()
+    print(f"Wrote {len(parsing_table)} states to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,319 @@
+"""
+Lightweight asyncio HTTP service for SLR table generation and parsing.
+
+Runs the same pipeline as the Streamlit app (parse_grammar through
+construct_parsing_table) behind a small JSON API, so several users or CI
+jobs can share one warm cache:
+
+    python service.py --port 8765
+
+    POST /table   {"grammar": "E -> E + T | T ..."}
+    POST /parse   {"grammar": "...", "input": "id + id"}   (or "tokens": [...])
+    GET  /health
+
+Table builds run in a process pool so the event loop never blocks, and
+concurrent requests for the same grammar are coalesced into a single build.
+It needs no outside services, only the app's own requirements (the worker
+processes import app.py, and with it its UI dependencies).
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from app import (
+    parse_grammar,
+    process_grammar,
+    compute_first_sets,
+    compute_follow_sets,
+    build_canonical_collection,
+    construct_parsing_table,
+    compile_parsing_table,
+    parse_tokens,
+    glr_parse,
+    ParseError,
+    get_productions,
+)
+
+MAX_BODY_SIZE = 16 * 1024 * 1024
+
+STATUS_TEXT = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+
+
+class RequestError(Exception):
+    """Raised for malformed requests; carries the HTTP status to answer with."""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+# --------------------------
+# Table Building (runs in worker processes)
+# --------------------------
+
+def grammar_key(grammar):
+    """Hash a parsed grammar; production order is kept since it fixes numbering."""
+    encoded = json.dumps(list(grammar.items()), separators=(',', ':'))
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def build_parser(grammar):
+    """Run the full table pipeline for a parsed grammar.
+    Returns a picklable dict with the JSON-ready summary under 'summary' and
+    the compiled driver table under 'table', so the parent process does no
+    per-cell work on the event loop.
+    """
+    start_symbol, terminals, non_terminals, augmented_grammar = process_grammar(grammar)
+    first_sets = compute_first_sets(grammar, terminals, non_terminals)
+    follow_sets = compute_follow_sets(grammar, non_terminals, start_symbol, first_sets)
+    canonical_collection, goto_table = build_canonical_collection(grammar, non_terminals, start_symbol)
+    parsing_table = construct_parsing_table(canonical_collection, goto_table, terminals, non_terminals,
+                                            augmented_grammar, grammar, follow_sets, start_symbol)
+    summary = {
+        'start_symbol': start_symbol,
+        'terminals': sorted(terminals),
+        'non_terminals': sorted(non_terminals),
+        'productions': get_productions(augmented_grammar),
+        'first_sets': {nt: sorted(first_sets[nt]) for nt in sorted(non_terminals)},
+        'follow_sets': {nt: sorted(follow_sets[nt]) for nt in sorted(non_terminals)},
+        'states': len(canonical_collection),
+        'parsing_table': {
+            str(state): {symbol: acts for symbol, acts in sorted(row.items()) if acts}
+            for state, row in parsing_table.items()
+        },
+    }
+    return {
+        'summary': summary,
+        'table': compile_parsing_table(parsing_table, augmented_grammar, non_terminals, follow_sets),
+    }
+
+
+# --------------------------
+# Service
+# --------------------------
+
+class ParserService:
+    """Shared table cache with request coalescing in front of a process pool."""
+
+    def __init__(self, workers=None, cache_size=128):
+        self.workers = workers
+        self.executor = ProcessPoolExecutor(max_workers=workers)
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._inflight = {}
+
+    async def get_tables(self, grammar):
+        """Return (key, entry) for a grammar, building it at most once at a time."""
+        key = grammar_key(grammar)
+        entry = self._cache.get(key)
+        if entry is not None:
+            self._cache.move_to_end(key)
+            return key, entry
+
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._build(key, grammar))
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return key, await asyncio.shield(future)
+
+    async def _build(self, key, grammar):
+        loop = asyncio.get_running_loop()
+        executor = self.executor
+        try:
+            entry = await loop.run_in_executor(executor, build_parser, grammar)
+        except BrokenProcessPool:
+            # A worker died mid-build, e.g. killed for running out of memory.
+            # Every build on that pool fails; replace it once so later
+            # requests get a fresh one.
+            if self.executor is executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+                self.executor = ProcessPoolExecutor(max_workers=self.workers)
+            raise RequestError(503, "A worker process died while building this grammar's table")
+        self._cache[key] = entry
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return entry
+
+    async def handle_table(self, payload):
+        key, entry = await self.get_tables(read_grammar(payload))
+        return dict(entry['summary'], grammar_hash=key)
+
+    async def handle_parse(self, payload):
+        key, entry = await self.get_tables(read_grammar(payload))
+        if 'tokens' in payload:
+            tokens = payload['tokens']
+            if not isinstance(tokens, list) or not all(isinstance(t, str) for t in tokens):
+                raise RequestError(400, "'tokens' must be a list of strings")
+        elif isinstance(payload.get('input'), str):
+            tokens = payload['input'].split()
+        else:
+            raise RequestError(400, "Expected 'input' string or 'tokens' list")
+
+        loop = asyncio.get_running_loop()
+        table = entry['table']
+        if table.conflicts:
+            # Conflicting cells: the GLR driver follows every action, and
+            # stops at the first token no stack can shift.
+            def parse():
+                try:
+                    glr_parse(tokens, table)
+                    return []
+                except ParseError as e:
+                    return [e]
+        else:
+            def parse():
+                errors = []
+                parse_tokens(tokens, table, errors=errors)
+                return errors
+        errors = await loop.run_in_executor(None, parse)
+        return {
+            'grammar_hash': key,
+            'driver': 'glr' if table.conflicts else 'lr',
+            'accepted': not errors,
+            'errors': [
+                {'position': e.position, 'token': e.token, 'expected': list(e.expected), 'message': str(e)}
+                for e in errors
+            ],
+        }
+
+    def close(self):
+        self.executor.shutdown(cancel_futures=True)
+
+
+def read_grammar(payload):
+    """Extract and parse the 'grammar' field of a request payload."""
+    grammar_input = payload.get('grammar')
+    if not isinstance(grammar_input, str):
+        raise RequestError(400, "Expected 'grammar' string")
+    grammar = parse_grammar(grammar_input)
+    if not grammar:
+        raise RequestError(400, "Grammar has no productions")
+    return grammar
+
+
+# --------------------------
+# HTTP Handling
+# --------------------------
+
+async def read_request(reader):
+    """Read one HTTP/1.1 request. Returns: method, path, body bytes."""
+    request_line = await reader.readline()
+    if not request_line:
+        return None
+    try:
+        method, path, _ = request_line.decode('latin-1').split(' ', 2)
+    except ValueError:
+        raise RequestError(400, "Malformed request line")
+
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+
+    try:
+        length = int(headers.get('content-length', 0))
+    except ValueError:
+        raise RequestError(400, "Invalid Content-Length")
+    if length > MAX_BODY_SIZE:
+        raise RequestError(413, "Request body too large")
+    body = await reader.readexactly(length) if length else b''
+    return method, path.split('?', 1)[0], body
+
+
+async def write_response(writer, status, payload):
+    body = json.dumps(payload).encode()
+    head = (
+        f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        "Connection: close\r\n\r\n"
+    )
+    writer.write(head.encode('latin-1') + body)
+    await writer.drain()
+
+
+async def dispatch(service, method, path, body):
+    if path == '/health':
+        return {'status': 'ok', 'cached_grammars': len(service._cache)}
+    routes = {'/table': service.handle_table, '/parse': service.handle_parse}
+    if path not in routes:
+        raise RequestError(404, f"Unknown path: {path}")
+    if method != 'POST':
+        raise RequestError(405, "Use POST")
+    try:
+        payload = json.loads(body or b'{}')
+    except ValueError:
+        raise RequestError(400, "Body is not valid JSON")
+    if not isinstance(payload, dict):
+        raise RequestError(400, "Body must be a JSON object")
+    return await routes[path](payload)
+
+
+def make_handler(service):
+    async def handle_connection(reader, writer):
+        try:
+            request = await read_request(reader)
+            if request is None:
+                return
+            status, payload = 200, await dispatch(service, *request)
+        except RequestError as e:
+            status, payload = e.status, {'error': str(e)}
+        except asyncio.IncompleteReadError:
+            status, payload = 400, {'error': "Incomplete request body"}
+        except Exception as e:
+            status, payload = 500, {'error': f"{type(e).__name__}: {e}"}
+        try:
+            await write_response(writer, status, payload)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+    return handle_connection
+
+
+async def serve(host, port, workers=None, cache_size=128):
+    service = ParserService(workers=workers, cache_size=cache_size)
+    server = await asyncio.start_server(make_handler(service), host, port)
+    addresses = ', '.join(str(sock.getsockname()) for sock in server.sockets)
+    print(f"SLR parser service listening on {addresses}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve SLR table generation and parsing over HTTP.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Worker processes for table builds (default: CPU count)")
+    parser.add_argument('--cache-size', type=int, default=128,
+                        help="Number of built grammars kept in memory")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers, args.cache_size))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()